@@ -1,20 +1,96 @@
 
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from datetime import datetime
+from tkinter import ttk
+import functools
+import mmap
 import os
 import json
+import queue
+import re
+import string
+import sys
+import threading
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Imported on first dialog; keeps tkinter.messagebox off the startup path
+messagebox = None
+
+
+def _messagebox():
+    """Return tkinter.messagebox, importing it on first use"""
+    global messagebox
+    if messagebox is None:
+        from tkinter import messagebox
+    return messagebox
+
+
+_DATE_RE = re.compile(r'^(\d{4})-(\d{2})-(\d{2})$')
+
+# Characters allowed in usernames (doubles as the tasks-file name)
+_USERNAME_CHARS = frozenset(string.ascii_letters + string.digits)
+_USERNAME_MAX_LEN = 64
+
+
+@functools.lru_cache(maxsize=512)
+def _valid_date(date_str):
+    """Check a YYYY-MM-DD date string; cheaper than strptime per call"""
+    from datetime import datetime
+
+    match = _DATE_RE.match(date_str)
+    if not match:
+        return False
+    year, month, day = match.groups()
+    try:
+        datetime(int(year), int(month), int(day))
+        return True
+    except ValueError:
+        return False
 
 
 class Task:
     """Represents a single task item"""
+
+    __slots__ = ("name", "priority", "due_date", "category", "status", "tag")
+
+    # Persisted fields and the defaults used for missing keys, so old
+    # task files keep loading as the schema grows
+    _FIELDS = ("name", "priority", "due_date", "category", "status")
+    _DEFAULTS = {"name": "", "priority": "Low", "due_date": "",
+                 "category": "Personal", "status": "Pending"}
+
     def __init__(self, name, priority="Low", due_date="", category="Personal", status="Pending"):
         self.name = name
-        self.priority = priority
+        # Priority/category/status come from tiny fixed vocabularies;
+        # interning makes equality checks a pointer compare
+        self.priority = sys.intern(priority)
         self.due_date = due_date
-        self.category = category
-        self.status = status
+        self.category = sys.intern(category)
+        self.status = sys.intern(status)
+        self.tag = self._compute_tag()
+
+    def _compute_tag(self):
+        """Pick the Treeview display tag for this task"""
+        if self.status == "Completed":
+            return 'completed'
+        if self.priority == "High":
+            return 'pending_high'
+        return 'pending_low'
+
+    def set_priority(self, priority):
+        """Change priority and keep the display tag in sync"""
+        self.priority = sys.intern(priority)
+        self.tag = self._compute_tag()
+
+    def set_status(self, status):
+        """Change status and keep the display tag in sync"""
+        self.status = sys.intern(status)
+        self.tag = self._compute_tag()
 
     def to_dict(self):
         """Convert task to dictionary for JSON storage"""
@@ -26,16 +102,12 @@ class Task:
             "status": self.status
         }
 
-    @staticmethod
-    def from_dict(data):
-        """Create Task from dictionary"""
-        return Task(
-            name=data["name"],
-            priority=data["priority"],
-            due_date=data["due_date"],
-            category=data["category"],
-            status=data["status"]
-        )
+    @classmethod
+    def from_dict(cls, data):
+        """Create Task from dictionary, defaulting any missing fields"""
+        get = data.get
+        defaults = cls._DEFAULTS
+        return cls(**{k: get(k, defaults[k]) for k in cls._FIELDS})
 
     def __str__(self):
         return f"{self.name} | {self.priority} | {self.due_date} | {self.category} | {self.status}"
@@ -44,25 +116,52 @@ class Task:
 class TaskStorage:
     """Handles saving and loading tasks from file"""
 
+    # Files above this size are memory-mapped instead of read()
+    MMAP_THRESHOLD = 64 * 1024
+
     def __init__(self, username):
         self.username = username
         self.filename = f"{username}_tasks.json"
 
     def save_tasks(self, tasks):
         """Save tasks to JSON file"""
-        data = [task.to_dict() for task in tasks]
-        with open(self.filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        self.save_data([task.to_dict() for task in tasks])
+
+    def save_data(self, data):
+        """Write an already-snapshotted list of task dicts to disk"""
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            # json.dump issues one tiny write per token; dumps + a
+            # single write is much faster for whole-file rewrites
+            payload = json.dumps(data, indent=2).encode('utf-8')
+
+        # Write to a sibling tempfile and swap it in, so a crash
+        # mid-write never leaves a truncated tasks file behind
+        tmp = self.filename + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp, self.filename)
 
     def load_tasks(self):
         """Load tasks from JSON file"""
         if not os.path.exists(self.filename):
             return []
         try:
-            with open(self.filename, 'r') as f:
-                data = json.load(f)
-                return [Task.from_dict(item) for item in data]
-        except (json.JSONDecodeError, KeyError):
+            size = os.stat(self.filename).st_size
+            if size == 0:
+                return []
+            with open(self.filename, 'rb') as f:
+                if size > self.MMAP_THRESHOLD and orjson is not None:
+                    # Parse straight out of the page cache, skipping the
+                    # user-space copy a read() would make
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = orjson.loads(memoryview(mm))
+                else:
+                    raw = f.read()
+                    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            return [Task.from_dict(item) for item in data]
+        except ValueError:
             return []
 
 
@@ -122,11 +221,16 @@ class LoginWindow:
         username = self.username_entry.get().strip()
 
         if not username:
-            messagebox.showerror("Error", "Please enter a username")
+            _messagebox().showerror("Error", "Please enter a username")
+            return
+
+        if len(username) > _USERNAME_MAX_LEN:
+            _messagebox().showerror("Error",
+                                 f"Username must be at most {_USERNAME_MAX_LEN} characters")
             return
 
-        if not username.isalnum():
-            messagebox.showerror("Error", "Username must contain only letters and numbers")
+        if not _USERNAME_CHARS.issuperset(username):
+            _messagebox().showerror("Error", "Username must contain only letters and numbers")
             return
 
         # Clear login window and proceed
@@ -139,16 +243,35 @@ class LoginWindow:
 class ToDoApp:
     """Main To-Do List Application"""
 
-    CATEGORIES = ["Work", "Personal", "Study", "Shopping", "Health", "Other"]
-    PRIORITIES = ["High", "Low"]
+    CATEGORIES = [sys.intern(c) for c in
+                  ("Work", "Personal", "Study", "Shopping", "Health", "Other")]
+    PRIORITIES = [sys.intern(p) for p in ("High", "Low")]
+
+    # ttk styles are global to the Tk app; configure them only once
+    _styles_configured = False
 
     def __init__(self, root, username):
         self.root = root
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.reset(username)
+
+    def reset(self, username):
+        """Bind per-user state and (re)build the task UI"""
         self.username = username
         self.storage = TaskStorage(username)
         self.tasks = self.storage.load_tasks()
-        self.selected_index = None
-
+        self.selected_iid = None
+        self._save_pending = None
+        self._row_cache = {}
+        self._iid_to_task = {}
+        self._pending_count = 0
+        self._completed_count = 0
+        self._write_q = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+
+        # Undo the login screen's small fixed-size window
         self.root.title(f"To-Do List - {username}")
         self.root.geometry("900x600")
         self.root.minsize(800, 500)
@@ -156,12 +279,81 @@ class ToDoApp:
         self.create_widgets()
         self.refresh_task_list()
 
+    SAVE_DELAY_MS = 200
+
+    def schedule_save(self):
+        """Schedule a debounced save so bursts of edits write once"""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+        self._save_pending = self.root.after(self.SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        """Hand a snapshot of the task list to the writer thread"""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self._save_pending = None
+        # Snapshot on the main thread so the writer never touches
+        # live Task objects
+        self._write_q.put([task.to_dict() for task in self.tasks])
+
+    def _writer_loop(self):
+        """Background thread: write queued snapshots, newest wins"""
+        while True:
+            data = self._write_q.get()
+            stop = data is None
+            # Coalesce any snapshots that piled up behind this one
+            while True:
+                try:
+                    newer = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                self._write_q.task_done()
+                if newer is None:
+                    stop = True
+                else:
+                    data = newer
+            try:
+                if data is not None:
+                    self.storage.save_data(data)
+            except OSError as e:
+                # Keep the thread alive so later saves still run, and
+                # report the failure back on the Tk thread
+                self.root.after(0, self._report_save_error, e)
+            finally:
+                self._write_q.task_done()
+            if stop:
+                break
+
+    def _report_save_error(self, error):
+        """Surface a failed background write; runs on the Tk thread"""
+        self.status_label.config(text=f"Saving tasks failed: {error}")
+        _messagebox().showerror("Error", f"Could not save tasks:\n{error}")
+
+    def _shutdown_writer(self):
+        """Flush pending changes and stop the writer thread"""
+        # Already stopped (logout then window close): joining the queue
+        # again would block forever with no consumer
+        if self._writer is None:
+            return
+        if self._save_pending is not None:
+            self._flush_save()
+        self._write_q.put(None)
+        self._write_q.join()
+        self._writer = None
+
+    def on_close(self):
+        """Flush pending changes before the window is destroyed"""
+        self._shutdown_writer()
+        self.root.destroy()
+
     def create_widgets(self):
         """Create all GUI widgets"""
-        # Configure style
-        style = ttk.Style()
-        style.configure('Title.TLabel', font=('Helvetica', 14, 'bold'))
-        style.configure('Header.TLabel', font=('Helvetica', 10, 'bold'))
+        # Configure style once per process; re-login reuses the entries
+        if not ToDoApp._styles_configured:
+            style = ttk.Style()
+            style.configure('Title.TLabel', font=('Helvetica', 14, 'bold'))
+            style.configure('Header.TLabel', font=('Helvetica', 10, 'bold'))
+            ToDoApp._styles_configured = True
 
         # Main container
         main_container = ttk.Frame(self.root, padding="10")
@@ -278,39 +470,76 @@ class ToDoApp:
         self.task_count_label = ttk.Label(status_frame, text="")
         self.task_count_label.pack(side=tk.RIGHT)
 
+    @staticmethod
+    def _row_for(task):
+        """Build the (values, tag) pair displayed for a task"""
+        values = (task.name, task.priority, task.due_date, task.category, task.status)
+        return values, task.tag
+
+    def _insert_row(self, task):
+        """Append a row for task under a fresh stable iid"""
+        iid = uuid.uuid4().hex
+        values, tag = self._row_for(task)
+        self.task_tree.insert("", tk.END, iid=iid, values=values, tags=(tag,))
+        self._row_cache[iid] = (values, tag)
+        self._iid_to_task[iid] = task
+        return iid
+
+    def _update_row(self, iid, task):
+        """Update a task's row in place, skipping no-op redraws"""
+        row = self._row_for(task)
+        if self._row_cache.get(iid) == row:
+            return
+        values, tag = row
+        self.task_tree.item(iid, values=values, tags=(tag,))
+        self._row_cache[iid] = row
+
+    def _delete_row(self, iid):
+        """Delete a single row; stable iids leave the rest untouched"""
+        self.task_tree.delete(iid)
+        del self._row_cache[iid]
+        del self._iid_to_task[iid]
+
+    def _update_count_label(self):
+        """Refresh the total/pending/completed counts in the status bar"""
+        self.task_count_label.config(
+            text=f"Total: {len(self.tasks)} | "
+                 f"Pending: {self._pending_count} | "
+                 f"Completed: {self._completed_count}"
+        )
+
     def refresh_task_list(self):
-        """Refresh the task list display"""
+        """Rebuild the task list display from scratch"""
         # Clear existing items
         for item in self.task_tree.get_children():
             self.task_tree.delete(item)
+        self._row_cache.clear()
+        self._iid_to_task.clear()
 
-        # Add tasks to treeview
-        for i, task in enumerate(self.tasks):
-            # Determine tag based on status and priority
-            if task.status == "Completed":
-                tag = 'completed'
-            elif task.priority == "High":
-                tag = 'pending_high'
-            else:
-                tag = 'pending_low'
-
-            self.task_tree.insert("", tk.END, iid=i, values=(
-                task.name, task.priority, task.due_date, task.category, task.status
-            ), tags=(tag,))
+        # Hide the columns during the bulk insert so Tk recomputes the
+        # layout once at the end instead of per row
+        self.task_tree.configure(displaycolumns=())
+        try:
+            # Add tasks to treeview, tallying counts in the same pass
+            pending = completed = 0
+            for task in self.tasks:
+                self._insert_row(task)
+                pending += task.status == "Pending"
+                completed += task.status == "Completed"
+        finally:
+            self.task_tree.configure(displaycolumns='#all')
 
         # Update task count
-        pending = sum(1 for t in self.tasks if t.status == "Pending")
-        completed = sum(1 for t in self.tasks if t.status == "Completed")
-        self.task_count_label.config(
-            text=f"Total: {len(self.tasks)} | Pending: {pending} | Completed: {completed}"
-        )
+        self._pending_count = pending
+        self._completed_count = completed
+        self._update_count_label()
 
     def on_task_select(self, event):
         """Handle task selection in treeview"""
         selection = self.task_tree.selection()
         if selection:
-            self.selected_index = int(selection[0])
-            task = self.tasks[self.selected_index]
+            self.selected_iid = selection[0]
+            task = self._iid_to_task[self.selected_iid]
 
             # Populate form with selected task data
             self.task_name_entry.delete(0, tk.END)
@@ -324,13 +553,7 @@ class ToDoApp:
 
     def validate_date(self, date_str):
         """Validate date format (YYYY-MM-DD)"""
-        if not date_str:
-            return True  # Empty date is allowed
-        try:
-            datetime.strptime(date_str, "%Y-%m-%d")
-            return True
-        except ValueError:
-            return False
+        return not date_str or _valid_date(date_str)  # Empty date is allowed
 
     def get_form_data(self):
         """Get data from form fields"""
@@ -347,97 +570,114 @@ class ToDoApp:
 
         # Validation
         if not name:
-            messagebox.showerror("Error", "Task name is required")
+            _messagebox().showerror("Error", "Task name is required")
             return
 
         if not self.validate_date(due_date):
-            messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
+            _messagebox().showerror("Error", "Invalid date format. Use YYYY-MM-DD")
             return
 
         # Create and add task
         task = Task(name, priority, due_date, category, "Pending")
         self.tasks.append(task)
+        self._pending_count += 1
 
         # Save and refresh
-        self.storage.save_tasks(self.tasks)
-        self.refresh_task_list()
+        self.schedule_save()
+        self._insert_row(task)
+        self._update_count_label()
         self.clear_form()
 
         self.status_label.config(text=f"Task '{name}' added successfully")
-        messagebox.showinfo("Success", "Task added successfully!")
+        _messagebox().showinfo("Success", "Task added successfully!")
 
     def update_task(self):
         """Update the selected task"""
-        if self.selected_index is None:
-            messagebox.showerror("Error", "Please select a task to update")
+        if self.selected_iid is None:
+            _messagebox().showerror("Error", "Please select a task to update")
             return
 
         name, priority, due_date, category = self.get_form_data()
 
         # Validation
         if not name:
-            messagebox.showerror("Error", "Task name is required")
+            _messagebox().showerror("Error", "Task name is required")
             return
 
         if not self.validate_date(due_date):
-            messagebox.showerror("Error", "Invalid date format. Use YYYY-MM-DD")
+            _messagebox().showerror("Error", "Invalid date format. Use YYYY-MM-DD")
             return
 
         # Update task
-        task = self.tasks[self.selected_index]
+        task = self._iid_to_task[self.selected_iid]
+
+        # Nothing changed - skip the serialize+write cycle entirely
+        if (name, priority, due_date, category) == (
+                task.name, task.priority, task.due_date, task.category):
+            self.status_label.config(text=f"Task '{name}' unchanged")
+            return
+
         task.name = name
-        task.priority = priority
+        task.set_priority(priority)
         task.due_date = due_date
-        task.category = category
+        task.category = sys.intern(category)
 
         # Save and refresh
-        self.storage.save_tasks(self.tasks)
-        self.refresh_task_list()
+        self.schedule_save()
+        self._update_row(self.selected_iid, task)
 
         self.status_label.config(text=f"Task '{name}' updated successfully")
-        messagebox.showinfo("Success", "Task updated successfully!")
+        _messagebox().showinfo("Success", "Task updated successfully!")
 
     def delete_task(self):
         """Delete the selected task"""
-        if self.selected_index is None:
-            messagebox.showerror("Error", "Please select a task to delete")
+        if self.selected_iid is None:
+            _messagebox().showerror("Error", "Please select a task to delete")
             return
 
-        task = self.tasks[self.selected_index]
+        iid = self.selected_iid
+        task = self._iid_to_task[iid]
 
         # Confirm deletion
-        if messagebox.askyesno("Confirm Delete",
+        if _messagebox().askyesno("Confirm Delete",
                                f"Are you sure you want to delete '{task.name}'?"):
-            del self.tasks[self.selected_index]
+            self.tasks.remove(task)
+            if task.status == "Completed":
+                self._completed_count -= 1
+            else:
+                self._pending_count -= 1
 
             # Save and refresh
-            self.storage.save_tasks(self.tasks)
-            self.refresh_task_list()
+            self.schedule_save()
+            self._delete_row(iid)
+            self._update_count_label()
             self.clear_form()
 
             self.status_label.config(text=f"Task deleted successfully")
-            self.selected_index = None
 
     def mark_completed(self):
         """Mark the selected task as completed"""
-        if self.selected_index is None:
-            messagebox.showerror("Error", "Please select a task to mark as completed")
+        if self.selected_iid is None:
+            _messagebox().showerror("Error", "Please select a task to mark as completed")
             return
 
-        task = self.tasks[self.selected_index]
+        task = self._iid_to_task[self.selected_iid]
 
         if task.status == "Completed":
-            messagebox.showinfo("Info", "This task is already completed")
+            _messagebox().showinfo("Info", "This task is already completed")
             return
 
-        task.status = "Completed"
+        task.set_status("Completed")
+        self._pending_count -= 1
+        self._completed_count += 1
 
         # Save and refresh
-        self.storage.save_tasks(self.tasks)
-        self.refresh_task_list()
+        self.schedule_save()
+        self._update_row(self.selected_iid, task)
+        self._update_count_label()
 
         self.status_label.config(text=f"Task '{task.name}' marked as completed")
-        messagebox.showinfo("Success", "Task marked as completed!")
+        _messagebox().showinfo("Success", "Task marked as completed!")
 
     def clear_form(self):
         """Clear all form fields"""
@@ -445,7 +685,7 @@ class ToDoApp:
         self.priority_var.set("Low")
         self.due_date_entry.delete(0, tk.END)
         self.category_var.set("Personal")
-        self.selected_index = None
+        self.selected_iid = None
 
         # Clear selection in treeview
         for item in self.task_tree.selection():
@@ -455,7 +695,10 @@ class ToDoApp:
 
     def logout(self):
         """Logout and return to login screen"""
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+        if _messagebox().askyesno("Logout", "Are you sure you want to logout?"):
+            # Flush pending changes and stop this user's writer thread
+            self._shutdown_writer()
+
             # Clear current window
             for widget in self.root.winfo_children():
                 widget.destroy()
@@ -465,7 +708,7 @@ class ToDoApp:
 
     def on_login(self, username):
         """Callback when user logs in again"""
-        self.__init__(self.root, username)
+        self.reset(username)
 
 
 def main():